@@ -40,11 +40,8 @@ class BetaAuthTester:
                     return True, {}
             else:
                 print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                try:
-                    error_data = response.json()
-                    print(f"   Error: {error_data}")
-                except:
-                    print(f"   Error: {response.text}")
+                # No JSON decode on a mismatch; the head of the raw body identifies the error
+                print(f"   Error: {response.content[:200].decode('utf-8', 'replace')}")
                 return False, {}
 
         except Exception as e:
@@ -191,6 +188,19 @@ class BetaAuthTester:
         """Test getting current user info without token"""
         return self.run_test("Auth Me (No Token)", "GET", "/auth/me", 403)
 
+def report(tester):
+    """Print the final results and return the process exit code"""
+    print("\n" + "=" * 50)
+    print(f"📊 Final Results: {tester.tests_passed}/{tester.tests_run} tests passed")
+    
+    if tester.tests_passed == tester.tests_run:
+        print("🎉 All Beta Authentication tests passed!")
+        return 0
+    else:
+        failed_tests = tester.tests_run - tester.tests_passed
+        print(f"⚠️  {failed_tests} test(s) failed.")
+        return 1
+
 def main():
     print("🔐 Beta Authentication System Testing")
     print("=" * 50)
@@ -218,20 +228,17 @@ def main():
     
     # Test authenticated endpoints
     print("\n👤 Testing Authenticated Endpoints...")
-    tester.test_auth_me_with_token(login_token if login_success else access_token)
     tester.test_auth_me_without_token()
     
-    # Results
-    print("\n" + "=" * 50)
-    print(f"📊 Final Results: {tester.tests_passed}/{tester.tests_run} tests passed")
-    
-    if tester.tests_passed == tester.tests_run:
-        print("🎉 All Beta Authentication tests passed!")
-        return 0
-    else:
-        failed_tests = tester.tests_run - tester.tests_passed
-        print(f"⚠️  {failed_tests} test(s) failed.")
+    # Registration may fail on a re-run (user already exists), so only a missing token is fatal
+    token = login_token if login_success else access_token
+    if not token:
+        print("❌ No access token from registration or login - skipping authenticated endpoint tests")
+        report(tester)
         return 1
+    tester.test_auth_me_with_token(token)
+    
+    return report(tester)
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
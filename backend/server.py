@@ -1,5 +1,6 @@
-from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Form, Request
+from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Form, Request, Query
 from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -70,6 +71,7 @@ app.add_middleware(
 async def startup_event():
     """Run startup tasks"""
     await ensure_all_users_have_codes()
+    await ensure_boost_ticket_indexes()
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -408,6 +410,9 @@ class BoostTicketUpdate(BaseModel):
     resolution_type: Optional[ResolutionType] = None
     updated_by: Optional[str] = None  # Add field to track who made the update
 
+class BoostTicketBatchUpdate(BoostTicketUpdate):
+    id: str
+
 class BoostCommentCreate(BaseModel):
     body: str
     is_internal: bool = False
@@ -623,6 +628,22 @@ async def ensure_all_users_have_codes():
     except Exception as e:
         logger.error(f"Error ensuring users have codes: {e}")
 
+async def ensure_boost_ticket_indexes():
+    """Ensure the BOOST ticket lookups and list filters are served by indexes"""
+    try:
+        # create_index is a no-op when the index already exists
+        await db.boost_tickets.create_index("id")
+        await db.boost_tickets.create_index("owner_id")
+        await db.boost_tickets.create_index("requester_id")
+        await db.boost_tickets.create_index("requester_email")
+        await db.boost_tickets.create_index([("support_department", 1), ("status", 1), ("priority", 1)])
+        # Matches the list sort; id breaks created_at ties so limit/offset pages never overlap or skip
+        await db.boost_tickets.create_index([("created_at", -1), ("id", 1)])
+        logger.info("BOOST ticket indexes ensured")
+        
+    except Exception as e:
+        logger.error(f"Error ensuring BOOST ticket indexes: {e}")
+
 def auto_prefix_subject(department: SupportDepartment, category: str, subject: str) -> str:
     """Auto-prefix subject with department and category"""
     dept_name = department.value  # Get the actual string value from enum
@@ -3501,40 +3522,44 @@ async def delete_boost_user(user_id: str):
         raise HTTPException(status_code=500, detail="Failed to delete user")
 
 # BOOST Tickets
+async def build_boost_ticket(ticket_data: BoostTicketCreate) -> BoostTicket:
+    """Build a BOOST ticket from create data (prefixed subject, SLA due date, business unit name)"""
+    # Auto-prefix subject
+    prefixed_subject = auto_prefix_subject(
+        ticket_data.support_department,
+        ticket_data.category,
+        ticket_data.subject
+    )
+    
+    # Calculate SLA due date
+    created_at = datetime.now(timezone.utc)
+    due_at = calculate_boost_sla_due(ticket_data.priority, created_at)
+    
+    # Get business unit name if provided
+    business_unit_name = None
+    if ticket_data.business_unit_id:
+        unit = await db.boost_business_units.find_one({"id": ticket_data.business_unit_id})
+        if unit:
+            business_unit_name = unit["name"]
+    
+    # Create ticket data dict and update with calculated values
+    ticket_dict = ticket_data.dict()
+    ticket_dict.update({
+        "subject": prefixed_subject,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "due_at": due_at,
+        "business_unit_name": business_unit_name,
+        # Use the provided requester_id instead of hardcoding "default_user"
+    })
+    
+    return BoostTicket(**ticket_dict)
+
 @api_router.post("/boost/tickets", response_model=BoostTicket)
 async def create_boost_ticket(ticket_data: BoostTicketCreate):
     """Create a new BOOST ticket"""
     try:
-        # Auto-prefix subject
-        prefixed_subject = auto_prefix_subject(
-            ticket_data.support_department,
-            ticket_data.category,
-            ticket_data.subject
-        )
-        
-        # Calculate SLA due date
-        created_at = datetime.now(timezone.utc)
-        due_at = calculate_boost_sla_due(ticket_data.priority, created_at)
-        
-        # Get business unit name if provided
-        business_unit_name = None
-        if ticket_data.business_unit_id:
-            unit = await db.boost_business_units.find_one({"id": ticket_data.business_unit_id})
-            if unit:
-                business_unit_name = unit["name"]
-        
-        # Create ticket data dict and update with calculated values
-        ticket_dict = ticket_data.dict()
-        ticket_dict.update({
-            "subject": prefixed_subject,
-            "created_at": created_at,
-            "updated_at": created_at,
-            "due_at": due_at,
-            "business_unit_name": business_unit_name,
-            # Use the provided requester_id instead of hardcoding "default_user"
-        })
-        
-        ticket = BoostTicket(**ticket_dict)
+        ticket = await build_boost_ticket(ticket_data)
         
         await db.boost_tickets.insert_one(ticket.dict())
         return ticket
@@ -3543,6 +3568,20 @@ async def create_boost_ticket(ticket_data: BoostTicketCreate):
         logger.error(f"Error creating BOOST ticket: {e}")
         raise HTTPException(status_code=500, detail="Failed to create ticket")
 
+@api_router.post("/boost/tickets/batch", response_model=List[BoostTicket])
+async def create_boost_tickets_batch(tickets_data: List[BoostTicketCreate]):
+    """Create several BOOST tickets in one request, returned in the order they were sent"""
+    try:
+        tickets = [await build_boost_ticket(ticket_data) for ticket_data in tickets_data]
+        
+        if tickets:
+            await db.boost_tickets.insert_many([ticket.dict() for ticket in tickets])
+        return tickets
+        
+    except Exception as e:
+        logger.error(f"Error batch creating BOOST tickets: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create tickets")
+
 @api_router.get("/boost/tickets", response_model=List[BoostTicket])
 async def get_boost_tickets(
     status: Optional[TicketStatus] = None,
@@ -3551,12 +3590,19 @@ async def get_boost_tickets(
     business_unit_id: Optional[str] = None,
     requester_id: Optional[str] = None,
     owner_id: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    fields: Optional[str] = None,
+    ids: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
 ):
-    """Get BOOST tickets with optional filtering"""
+    """Get BOOST tickets with optional filtering, paging (limit/offset) and a comma-separated field projection"""
     try:
         query = {}
         
+        if ids:
+            # Multi-get: comma-separated ticket ids in one request
+            query["id"] = {"$in": [ticket_id.strip() for ticket_id in ids.split(",") if ticket_id.strip()]}
         if status:
             query["status"] = status
         if priority:
@@ -3575,7 +3621,15 @@ async def get_boost_tickets(
                 {"description": {"$regex": search, "$options": "i"}}
             ]
         
-        tickets = await db.boost_tickets.find(query).sort("created_at", -1).to_list(1000)
+        projection = None
+        if fields:
+            # Only ship the requested fields; partial documents bypass the BoostTicket model
+            projection = {field.strip(): 1 for field in fields.split(",") if field.strip()}
+            projection["_id"] = 0
+        
+        tickets = await db.boost_tickets.find(query, projection).sort([("created_at", -1), ("id", 1)]).skip(offset).limit(limit).to_list(limit)
+        if projection:
+            return JSONResponse(content=jsonable_encoder(tickets))
         return [BoostTicket(**ticket) for ticket in tickets]
         
     except Exception as e:
@@ -3594,86 +3648,108 @@ async def get_boost_ticket(ticket_id: str):
         logger.error(f"Error fetching BOOST ticket: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch ticket")
 
-@api_router.put("/boost/tickets/{ticket_id}", response_model=BoostTicket)
-async def update_boost_ticket(ticket_id: str, update_data: BoostTicketUpdate):
-    """Update a BOOST ticket"""
-    try:
-        # Get the current ticket to compare changes
-        current_ticket = await db.boost_tickets.find_one({"id": ticket_id})
-        if not current_ticket:
-            raise HTTPException(status_code=404, detail="Ticket not found")
-        
-        update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
-        update_dict["updated_at"] = datetime.now(timezone.utc)
-        
-        # Track changes for audit trail
-        changes_made = []
-        user_name = update_dict.get("updated_by", "System")  # Get user name from frontend
-        
-        # Handle status transitions
-        if update_data.status and update_data.status != current_ticket.get("status"):
-            old_status = current_ticket.get("status", "unknown")
-            new_status = update_data.status
-            changes_made.append({
-                "action": "status_changed",
-                "description": f"Status changed from {old_status.replace('_', ' ')} to {new_status.replace('_', ' ')}",
-                "old_value": old_status,
-                "new_value": new_status
-            })
-            
-            if update_data.status == TicketStatus.RESOLVED:
-                update_dict["resolved_at"] = datetime.now(timezone.utc)
-            elif update_data.status == TicketStatus.CLOSED:
-                update_dict["closed_at"] = datetime.now(timezone.utc)
+async def apply_boost_ticket_update(ticket_id: str, update_data: BoostTicketUpdate) -> BoostTicket:
+    """Apply an update to a BOOST ticket, logging an audit entry for each change"""
+    # Get the current ticket to compare changes
+    current_ticket = await db.boost_tickets.find_one({"id": ticket_id})
+    if not current_ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    
+    # "id" is only present on batch items and is not a ticket field to set
+    update_dict = {k: v for k, v in update_data.dict(exclude={"id"}).items() if v is not None}
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    
+    # Track changes for audit trail
+    changes_made = []
+    user_name = update_dict.get("updated_by", "System")  # Get user name from frontend
+    
+    # Handle status transitions
+    if update_data.status and update_data.status != current_ticket.get("status"):
+        old_status = current_ticket.get("status", "unknown")
+        new_status = update_data.status
+        changes_made.append({
+            "action": "status_changed",
+            "description": f"Status changed from {old_status.replace('_', ' ')} to {new_status.replace('_', ' ')}",
+            "old_value": old_status,
+            "new_value": new_status
+        })
         
-        # Handle priority changes
-        if update_data.priority and update_data.priority != current_ticket.get("priority"):
-            old_priority = current_ticket.get("priority", "unknown")
-            new_priority = update_data.priority
+        if update_data.status == TicketStatus.RESOLVED:
+            update_dict["resolved_at"] = datetime.now(timezone.utc)
+        elif update_data.status == TicketStatus.CLOSED:
+            update_dict["closed_at"] = datetime.now(timezone.utc)
+    
+    # Handle priority changes
+    if update_data.priority and update_data.priority != current_ticket.get("priority"):
+        old_priority = current_ticket.get("priority", "unknown")
+        new_priority = update_data.priority
+        changes_made.append({
+            "action": "priority_changed",
+            "description": f"Priority changed from {old_priority} to {new_priority}",
+            "old_value": old_priority,
+            "new_value": new_priority
+        })
+    
+    # Handle assignment changes
+    if "owner_id" in update_dict:
+        old_owner = current_ticket.get("owner_name", "Unassigned")
+        new_owner = update_data.owner_name or "Unassigned"
+        if old_owner != new_owner:
             changes_made.append({
-                "action": "priority_changed",
-                "description": f"Priority changed from {old_priority} to {new_priority}",
-                "old_value": old_priority,
-                "new_value": new_priority
+                "action": "assigned",
+                "description": f"Assigned from {old_owner} to {new_owner}",
+                "old_value": old_owner,
+                "new_value": new_owner
             })
-        
-        # Handle assignment changes
-        if "owner_id" in update_dict:
-            old_owner = current_ticket.get("owner_name", "Unassigned")
-            new_owner = update_data.owner_name or "Unassigned"
-            if old_owner != new_owner:
-                changes_made.append({
-                    "action": "assigned",
-                    "description": f"Assigned from {old_owner} to {new_owner}",
-                    "old_value": old_owner,
-                    "new_value": new_owner
-                })
-        
-        # Update the ticket
-        result = await db.boost_tickets.update_one(
-            {"id": ticket_id},
-            {"$set": update_dict}
+    
+    # Update the ticket
+    result = await db.boost_tickets.update_one(
+        {"id": ticket_id},
+        {"$set": update_dict}
+    )
+    
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    
+    # Log audit entries for all changes
+    for change in changes_made:
+        await log_audit_entry(
+            ticket_id=ticket_id,
+            action=change["action"],
+            description=change["description"],
+            user_name=user_name,
+            details=f"Changed from '{change['old_value']}' to '{change['new_value']}'",
+            old_value=change["old_value"],
+            new_value=change["new_value"]
         )
-        
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Ticket not found")
-        
-        # Log audit entries for all changes
-        for change in changes_made:
-            await log_audit_entry(
-                ticket_id=ticket_id,
-                action=change["action"],
-                description=change["description"],
-                user_name=user_name,
-                details=f"Changed from '{change['old_value']}' to '{change['new_value']}'",
-                old_value=change["old_value"],
-                new_value=change["new_value"]
-            )
-        
-        # Get and return updated ticket
-        updated_ticket = await db.boost_tickets.find_one({"id": ticket_id})
-        return BoostTicket(**updated_ticket)
-        
+    
+    # Get and return updated ticket
+    updated_ticket = await db.boost_tickets.find_one({"id": ticket_id})
+    return BoostTicket(**updated_ticket)
+
+@api_router.put("/boost/tickets/batch", response_model=List[BoostTicket])
+async def update_boost_tickets_batch(updates: List[BoostTicketBatchUpdate]):
+    """Update several BOOST tickets in one request; each item carries the ticket id"""
+    try:
+        # Reject the whole batch before writing anything if any ticket is missing
+        requested_ids = {update.id for update in updates}
+        found = await db.boost_tickets.find({"id": {"$in": list(requested_ids)}}, {"_id": 0, "id": 1}).to_list(len(requested_ids))
+        missing_ids = requested_ids - {ticket["id"] for ticket in found}
+        if missing_ids:
+            raise HTTPException(status_code=404, detail=f"Tickets not found: {', '.join(sorted(missing_ids))}")
+        
+        return [await apply_boost_ticket_update(update.id, update) for update in updates]
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error batch updating BOOST tickets: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update tickets")
+
+@api_router.put("/boost/tickets/{ticket_id}", response_model=BoostTicket)
+async def update_boost_ticket(ticket_id: str, update_data: BoostTicketUpdate):
+    """Update a BOOST ticket"""
+    try:
+        return await apply_boost_ticket_update(ticket_id, update_data)
     except Exception as e:
         logger.error(f"Error updating BOOST ticket: {e}")
         raise HTTPException(status_code=500, detail="Failed to update ticket")
@@ -4049,10 +4125,11 @@ def validate_email_domain(email: str) -> bool:
     domain = email.split('@')[-1].lower()
     return domain == "adamsmithinternational.com"
 
+EMAIL_FORMAT_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def validate_email_format(email: str) -> bool:
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_FORMAT_RE.match(email) is not None
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> BetaUser:
     """Get current user from token"""